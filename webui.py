@@ -4,6 +4,7 @@ import os
 import sys
 import threading
 import time
+import uuid
 
 import warnings
 
@@ -117,7 +118,7 @@ def gen_single(emo_control_method,prompt, text,
                 *args, progress=gr.Progress()):
     output_path = None
     if not output_path:
-        output_path = os.path.join("outputs", f"spk_{int(time.time())}.wav")
+        output_path = os.path.join("outputs", f"spk_{int(time.time())}_{uuid.uuid4().hex[:8]}.wav")
     # set gradio progress
     tts.gr_progress = progress
     do_sample, top_p, top_k, temperature, \
@@ -183,7 +184,6 @@ with gr.Blocks(title="IndexTTS Demo") as demo:
 
     with gr.Tab(i18n("音频生成")):
         with gr.Row():
-            os.makedirs("prompts",exist_ok=True)
             prompt_audio = gr.Audio(label=i18n("音色参考音频"),key="prompt_audio",
                                     sources=["upload","microphone"],type="filepath")
             prompt_list = os.listdir("prompts")
@@ -433,10 +433,14 @@ with gr.Blocks(title="IndexTTS Demo") as demo:
                              max_text_tokens_per_segment,
                              *advanced_params,
                      ],
-                     outputs=[output_audio])
+                     outputs=[output_audio],
+                     # explicit copy of gradio's default (1): the model is shared and tracks `gr_progress`,
+                     # so generations must never run concurrently, even if the default changes
+                     concurrency_limit=1)
 
 
 
 if __name__ == "__main__":
-    demo.queue(20)
+    # NOTE: the first positional argument of `queue()` is `status_update_rate`, not the queue size.
+    demo.queue(max_size=20)
     demo.launch(server_name=cmd_args.host, server_port=cmd_args.port)